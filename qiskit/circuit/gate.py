@@ -216,6 +216,11 @@ class Gate(Instruction, Operation):
 
     def validate_parameter(self, parameter):
         """Gate parameters should be int, float, or ParameterExpression"""
+        # Fast path for the overwhelmingly common case of a plain Python number; a type identity
+        # check is much cheaper than the ``isinstance`` chain below.
+        parameter_type = type(parameter)
+        if parameter_type is float or parameter_type is int:
+            return parameter
         if isinstance(parameter, ParameterExpression):
             if len(parameter.parameters) > 0:
                 return parameter  # expression has free parameters, we cannot validate it
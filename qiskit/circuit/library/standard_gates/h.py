@@ -47,6 +47,8 @@ class HGate(Gate):
                 1 & -1
             \end{pmatrix}
     """
+    # Define class constants. This saves future allocation time.
+    _matrix = numpy.array([[1, 1], [1, -1]]) / numpy.sqrt(2)
 
     def __init__(self, label: Optional[str] = None):
         """Create new H gate."""
@@ -99,6 +101,10 @@ class HGate(Gate):
 
     def __array__(self, dtype=None):
         """Return a Numpy.array for the H gate."""
+        # The cached matrix is real, so it casts exactly to any floating or complex type.  Always
+        # return a copy, since callers are free to modify the result in place.
+        if dtype is None or numpy.dtype(dtype).kind in "fc":
+            return numpy.array(self._matrix, dtype=dtype)
         return numpy.array([[1, 1], [1, -1]], dtype=dtype) / numpy.sqrt(2)
 
 
@@ -211,6 +217,5 @@ class CHGate(ControlledGate):
     def __array__(self, dtype=None):
         """Return a numpy.array for the CH gate."""
         mat = self._matrix1 if self.ctrl_state else self._matrix0
-        if dtype:
-            return numpy.asarray(mat, dtype=dtype)
-        return mat
+        # Always return a copy, since callers are free to modify the result in place.
+        return numpy.array(mat, dtype=dtype)
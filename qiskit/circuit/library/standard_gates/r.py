@@ -12,6 +12,7 @@
 
 """Rotation around an axis in x-y plane."""
 
+import cmath
 import math
 from typing import Optional
 import numpy
@@ -74,13 +75,29 @@ class RGate(Gate):
 
         r(θ, φ)^dagger = r(-θ, φ)
         """
-        return RGate(-self.params[0], self.params[1])
+        return RGate._unchecked(-self.params[0], self.params[1])
+
+    @staticmethod
+    def _unchecked(theta, phi):
+        """Construct an :class:`RGate` from parameters that are already known to be valid.
+
+        This skips the per-parameter validation in :meth:`Gate.validate_parameter`, and so must only
+        be called with values taken from an existing gate."""
+        gate = RGate.__new__(RGate)
+        Gate.__init__(gate, "r", 1, [])
+        gate._params = [theta, phi]
+        return gate
 
     def __array__(self, dtype=None):
         """Return a numpy.array for the R gate."""
         theta, phi = float(self.params[0]), float(self.params[1])
         cos = math.cos(theta / 2)
-        sin = math.sin(theta / 2)
-        exp_m = numpy.exp(-1j * phi)
-        exp_p = numpy.exp(1j * phi)
-        return numpy.array([[cos, -1j * exp_m * sin], [-1j * exp_p * sin, cos]], dtype=dtype)
+        isin = -1j * math.sin(theta / 2)
+        # exp(-i phi) is just the conjugate of exp(i phi), so only one exponential is needed.
+        exp_p = cmath.exp(1j * phi)
+        out = numpy.empty((2, 2), dtype=complex)
+        out[0, 0] = cos
+        out[0, 1] = isin * exp_p.conjugate()
+        out[1, 0] = isin * exp_p
+        out[1, 1] = cos
+        return out if dtype is None else out.astype(dtype, copy=False)
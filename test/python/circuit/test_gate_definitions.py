@@ -14,6 +14,7 @@
 """Test hardcoded decomposition rules and matrix definitions for standard gates."""
 
 import inspect
+import warnings
 
 import numpy as np
 from ddt import ddt, data, unpack
@@ -21,7 +22,7 @@ from ddt import ddt, data, unpack
 from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.quantum_info import Operator
 from qiskit.test import QiskitTestCase
-from qiskit.circuit import ParameterVector, Gate, ControlledGate
+from qiskit.circuit import ParameterVector, Parameter, ParameterExpression, Gate, ControlledGate
 
 from qiskit.circuit.library import standard_gates
 from qiskit.circuit.library import (
@@ -71,6 +72,7 @@ from qiskit.circuit.library.standard_gates.equivalence_library import (
 from .gate_utils import _get_free_params
 
 
+@ddt
 class TestGateDefinitions(QiskitTestCase):
     """Test the decomposition of a gate in terms of other gates
     yields the equivalent matrix as the hardcoded matrix definition
@@ -83,6 +85,97 @@ class TestGateDefinitions(QiskitTestCase):
         decomposed_circ = circ.decompose()
         self.assertTrue(Operator(circ).equiv(Operator(decomposed_circ)))
 
+    @data(HGate, CHGate)
+    def test_definitions_independent(self, gate_class):
+        """Test that modifying one gate's definition does not affect other definitions."""
+        expected = [instruction.name for instruction, _, _ in gate_class().definition.data]
+
+        first = gate_class().definition
+        first.x(0)
+        first.data[0][0].params.append(1.0)
+        first.add_register(QuantumRegister(name="alias", bits=first.qubits))
+        with first.for_loop(range(2)):
+            second = gate_class().definition
+            second.x(0)
+        self.assertEqual([instruction.name for instruction, _, _ in second.data], expected + ["x"])
+        self.assertEqual(len(first.data), len(expected) + 2)
+        self.assertEqual(first.data[-1][0].name, "for_loop")
+
+        fresh = gate_class().definition
+        self.assertEqual([instruction.name for instruction, _, _ in fresh.data], expected)
+        self.assertNotIn(1.0, fresh.data[0][0].params)
+        self.assertEqual([register.name for register in fresh.qregs], ["q"])
+        for qubit in fresh.qubits:
+            self.assertEqual(
+                [register.name for register, _ in fresh.find_bit(qubit).registers], ["q"]
+            )
+
+    @data(HGate, CHGate)
+    def test_matrix_not_shared(self, gate_class):
+        """Test that modifying a gate matrix in place does not affect later matrices."""
+        expected = gate_class().to_matrix().copy()
+        matrix = gate_class().to_matrix()
+        matrix[0, 0] = 99
+        np.testing.assert_allclose(gate_class().to_matrix(), expected)
+        np.testing.assert_allclose(np.asarray(gate_class()), expected)
+
+    def test_h_matrix_dtypes(self):
+        """Test that the H gate matrix can be requested in real and integer dtypes."""
+        expected = np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            as_float = np.asarray(HGate(), dtype=float)
+            as_int = HGate().__array__(dtype=int)
+        self.assertEqual(as_float.dtype, np.float64)
+        np.testing.assert_allclose(as_float, expected)
+        np.testing.assert_allclose(as_int, expected)
+        np.testing.assert_allclose(np.asarray(HGate(), dtype=complex), expected)
+
+    def test_r_matrix_dtypes(self):
+        """Test that the R gate matrix can be requested in complex and real dtypes."""
+        theta, phi = 0.3, 0.2
+        expected = np.array(
+            [
+                [np.cos(theta / 2), -1j * np.exp(-1j * phi) * np.sin(theta / 2)],
+                [-1j * np.exp(1j * phi) * np.sin(theta / 2), np.cos(theta / 2)],
+            ]
+        )
+        gate = RGate(theta, phi)
+        as_complex = gate.__array__(dtype=np.complex64)
+        self.assertEqual(as_complex.dtype, np.complex64)
+        np.testing.assert_allclose(as_complex, expected, rtol=1e-6)
+        with warnings.catch_warnings():
+            # Casting to a real type discards the imaginary part, as it always has.
+            warnings.simplefilter("ignore")
+            as_float = gate.__array__(dtype=float)
+            identity = RGate(0, 0).__array__(dtype=np.float32)
+        self.assertEqual(as_float.dtype, np.float64)
+        np.testing.assert_allclose(as_float, expected.real)
+        self.assertEqual(identity.dtype, np.float32)
+        np.testing.assert_allclose(identity, np.eye(2))
+
+    def test_r_inverse_parameter_expressions(self):
+        """Test that the R gate inverse keeps bound and unbound parameter expressions."""
+        theta, phi = Parameter("θ"), Parameter("φ")
+
+        unbound = RGate(2 * theta, phi)
+        inverse = unbound.inverse()
+        self.assertIs(type(inverse), RGate)
+        self.assertEqual(inverse.name, "r")
+        self.assertEqual(inverse.params, [-2 * theta, phi])
+        circuit = QuantumCircuit(1)
+        circuit.append(inverse, [0])
+        circuit.assign_parameters({theta: 0.3, phi: -0.7}, inplace=True)
+        np.testing.assert_allclose(
+            Operator(circuit).data, RGate(0.6, -0.7).to_matrix().conj().T, atol=1e-12
+        )
+
+        bound = RGate((2 * theta).bind({theta: 0.3}), (phi + 1).bind({phi: -1.7}))
+        inverse = bound.inverse()
+        self.assertIsInstance(inverse.params[0], ParameterExpression)
+        self.assertIsInstance(inverse.params[1], ParameterExpression)
+        np.testing.assert_allclose(inverse.to_matrix(), bound.to_matrix().conj().T, atol=1e-12)
+
     def test_ccx_definition(self):
         """Test ccx gate matrix and definition."""
         circ = QuantumCircuit(3)